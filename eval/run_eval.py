@@ -2,18 +2,143 @@
 """CLI entry point for MCP server evaluation."""
 
 import argparse
-import json
+import asyncio
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
-from mcp_data_check import run_evaluation
+from mcp_data_check import Evaluator
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Write partial results after this many completed questions so a crash keeps progress
+FLUSH_EVERY = 25
+
+# Above this many questions, results default to JSON Lines so they are written one record at a time
+JSONL_THRESHOLD = 1000
+
+
+def summarize(results):
+    """Build the summary dict (same shape as mcp_data_check's) from per-question results."""
+    by_eval_type = {}
+    for r in results:
+        stats = by_eval_type.setdefault(r["eval_type"], {"total": 0, "passed": 0})
+        stats["total"] += 1
+        if r["passed"]:
+            stats["passed"] += 1
+
+    total = len(results)
+    passed = sum(1 for r in results if r["passed"])
+
+    return {
+        "total": total,
+        "passed": passed,
+        "failed": total - passed,
+        "pass_rate": passed / total if total > 0 else 0.0,
+        "by_eval_type": by_eval_type,
+    }
+
+
+def build_results(results, metadata):
+    """Assemble the results file contents from per-question results, skipping unfinished ones."""
+    done = [r for r in results if r is not None]
+    return {"summary": summarize(done), "results": done, "metadata": metadata}
+
+
+def append_results(output_path, records):
+    """
+    Append finished results to a .jsonl file, one per line, in completion order.
+
+    Each record is an (index, result) pair; the question's index in the questions
+    file is stored with the result so the original order can be restored.
+    """
+    with open(output_path, "ab") as f:
+        for i, r in records:
+            f.write(orjson.dumps({"index": i, **r}))
+            f.write(b"\n")
+
+
+def write_results(output_path, results, json_option=0):
+    """
+    Write results to output_path.
+
+    A .jsonl path already holds the records appended by append_results, so only the
+    summary and metadata are written, to a sibling .summary.json file. Any other path
+    gets a single JSON document.
+    """
+    if output_path.suffix == ".jsonl":
+        summary_path = output_path.with_suffix(".summary.json")
+        summary_path.write_bytes(orjson.dumps(
+            {"summary": results["summary"], "metadata": results["metadata"]},
+            option=json_option
+        ))
+    else:
+        output_path.write_bytes(orjson.dumps(results, option=json_option))
+
+
+async def evaluate_questions(evaluator, questions, parallelism, verbose, output_path, metadata, json_option=0):
+    """
+    Evaluate questions concurrently, each in a worker thread, bounded by a semaphore.
+
+    Each question costs a Claude call plus MCP tool calls, all network-bound, so running
+    them side by side cuts wall time roughly by the parallelism factor. Results keep the
+    order of the questions file.
+
+    Creating the output directory and writing results also run in worker threads so
+    file I/O never stalls the event loop, and the final results are written before
+    returning. A .json file is rewritten on every flush; a .jsonl file only gets the
+    newly finished results appended, and its summary is written once at the end.
+    """
+    # One spare worker so result flushes don't queue behind in-flight questions
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=parallelism + 1))
+    semaphore = asyncio.Semaphore(parallelism)
+    write_lock = asyncio.Lock()
+    results = [None] * len(questions)
+    completed = 0
+    jsonl = output_path.suffix == ".jsonl"
+    pending = []  # (index, result) pairs not yet appended to a .jsonl file
+
+    async def flush(snapshot=None):
+        nonlocal pending
+        async with write_lock:
+            if jsonl:
+                records, pending = pending, []
+                await asyncio.to_thread(append_results, output_path, records)
+            if snapshot is not None:
+                await asyncio.to_thread(write_results, output_path, snapshot, json_option)
+
+    await asyncio.to_thread(output_path.parent.mkdir, parents=True, exist_ok=True)
+    if jsonl:
+        await asyncio.to_thread(output_path.write_bytes, b"")
+
+    async def evaluate(i, question):
+        nonlocal completed
+        async with semaphore:
+            # the library only sees one question per call, so progress is reported here
+            if verbose:
+                print(f"Evaluating question {i+1}/{len(questions)}: {question['question'][:50]}...")
+            summary = await asyncio.to_thread(evaluator.run_evaluation, [question], verbose=False)
+        results[i] = summary.to_dict()["results"][0]
+        if jsonl:
+            pending.append((i, results[i]))
+        completed += 1
+        if verbose:
+            status = "PASS" if results[i]["passed"] else "FAIL"
+            print(f"  Result for question {i+1}: {status} ({completed}/{len(questions)} done)")
+        if completed % FLUSH_EVERY == 0:
+            await flush(None if jsonl else build_results(results, metadata))
+
+    await asyncio.gather(*(evaluate(i, q) for i, q in enumerate(questions)))
+
+    final = build_results(results, metadata)
+    await flush(final)
+    return final
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -50,6 +175,23 @@ def main():
         action="store_true",
         help="Print detailed progress"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the results JSON for reading (default: compact)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default=None,
+        help=f"Results file format (default: jsonl above {JSONL_THRESHOLD} questions, otherwise json)"
+    )
+    parser.add_argument(
+        "-p", "--parallelism",
+        type=int,
+        default=8,
+        help="Number of questions to evaluate concurrently (default: 8)"
+    )
 
     args = parser.parse_args()
 
@@ -74,19 +216,44 @@ def main():
         print(f"Error: Questions file not found: {questions_path}", file=sys.stderr)
         sys.exit(1)
 
-    # Run evaluation
+    evaluator = Evaluator(
+        server_url=args.server_url,
+        api_key=api_key,
+        model=args.model,
+        server_name=args.server_name
+    )
+
     print(f"Loading questions from {questions_path}...")
+    questions = evaluator.load_questions(questions_path)
+
+    # Results are flushed during the run, so pick the output path up front
+    output_format = args.format or ("jsonl" if len(questions) > JSONL_THRESHOLD else "json")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = output_dir / f"eval_{timestamp}.{output_format}"
+
+    # Run evaluation
     print(f"Evaluating against {args.server_url}...")
     print("-" * 50)
 
-    results = run_evaluation(
-        questions_filepath=questions_path,
-        api_key=api_key,
-        server_url=args.server_url,
-        model=args.model,
-        server_name=args.server_name,
-        verbose=args.verbose
-    )
+    # Results are read programmatically, so only indent them on request
+    json_option = orjson.OPT_INDENT_2 if args.pretty else 0
+
+    metadata = {
+        "server_url": args.server_url,
+        "model": args.model,
+        # same keys mcp_data_check.run_evaluation writes; older releases only support anthropic
+        "provider": getattr(evaluator, "provider", "anthropic"),
+        "timestamp": timestamp
+    }
+    results = asyncio.run(evaluate_questions(
+        evaluator,
+        questions,
+        parallelism=max(1, args.parallelism),
+        verbose=args.verbose,
+        output_path=output_path,
+        metadata=metadata,
+        json_option=json_option
+    ))
 
     summary = results["summary"]
 
@@ -117,14 +284,6 @@ def main():
             else:
                 print(f"  Details: {r.get('details', {}).get('details', 'N/A')}")
 
-    # Save results
-    output_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = output_dir / f"eval_{timestamp}.json"
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
-
     print(f"\nResults saved to: {output_path}")
 
     # Update badge.json for GitHub README
@@ -151,9 +310,7 @@ def main():
         "color": color
     }
 
-    with open(badge_path, "w", encoding="utf-8") as f:
-        json.dump(badge_data, f, indent=2)
-        f.write("\n")
+    badge_path.write_bytes(orjson.dumps(badge_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
     print(f"Badge updated: {badge_path}")
 
@@ -33,8 +33,10 @@ async def project_text_search(
         if refined_term in ["Search cancelled", "Information not provided"]:
             return {"error": refined_term, "total_results": total}
     
-        # Update search with refined term
-        search_params.advanced_text_search.search_text = refined_term
+        # Update search with refined term (models are frozen, so copy with the new text)
+        search_params = search_params.model_copy(update={
+            "advanced_text_search": search_params.advanced_text_search.model_copy(update={"search_text": refined_term})
+        })
         total, response = await get_initial_response(search_params, include_fields, limit)
         refinement_attempts += 1
 
@@ -1,8 +1,129 @@
-import json 
-from api_utils import get_all_responses, get_initial_response
+import argparse
+import asyncio
+import os
+import shelve
+import time
+import orjson
+from reporter import utils
 from reporter.models import SearchParams, AdvancedTextSearch, ProjectNum
 from reporter.utils import get_total_amount
 
+# Full responses are memoized on disk so repeated runs with unchanged inputs skip the network
+CACHE_DIR = ".explore_cache"
+CACHE_TTL = 86400
+CACHE_MAX_ENTRIES = 1024
+# Shelve key mapping every cached key to its store time, so expiry never unpickles responses
+_INDEX_KEY = "__index__"
+
+parser = argparse.ArgumentParser(description="Explore the NIH RePORTER API")
+parser.add_argument("--no-cache", action="store_true", help="Always query the API instead of reusing cached responses")
+USE_CACHE = not parser.parse_known_args()[0].no_cache
+
+def _open_cache():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return shelve.open(os.path.join(CACHE_DIR, "responses"))
+
+def _cache_key(*parts):
+    return orjson.dumps(parts, option=orjson.OPT_SORT_KEYS).decode()
+
+def _cache_fresh(cache, key):
+    """Check whether key is cached and younger than CACHE_TTL, deleting it if it has expired."""
+    index = cache.get(_INDEX_KEY, {})
+    stored_at = index.get(key)
+    if stored_at is None:
+        return False
+    if time.time() - stored_at < CACHE_TTL:
+        return True
+    del index[key]
+    cache[_INDEX_KEY] = index
+    cache.pop(key, None)
+    return False
+
+def _cache_get(cache, key):
+    return cache.get(key) if _cache_fresh(cache, key) else None
+
+def _cache_put(cache, key, value):
+    """Store value under key, then drop expired entries and the oldest beyond CACHE_MAX_ENTRIES."""
+    now = time.time()
+    index = cache.get(_INDEX_KEY, {})
+    cache[key] = value
+    index[key] = now
+    evict = [k for k, stored_at in index.items() if now - stored_at >= CACHE_TTL]
+    overflow = len(index) - len(evict) - CACHE_MAX_ENTRIES
+    if overflow > 0:
+        evict += sorted(index.keys() - set(evict), key=index.get)[:overflow]
+    for k in evict:
+        del index[k]
+        cache.pop(k, None)
+    cache[_INDEX_KEY] = index
+
+async def _cached(fn, search_params, include_fields, limit, client):
+    """Call an async RePORTER helper, reusing its result from disk for up to CACHE_TTL seconds."""
+    if not USE_CACHE:
+        return await fn(search_params, include_fields, limit, client=client)
+    key = _cache_key(fn.__name__, search_params.to_api_criteria(), include_fields, limit)
+    with _open_cache() as cache:
+        result = _cache_get(cache, key)
+    if result is None:
+        result = await fn(search_params, include_fields, limit, client=client)
+        with _open_cache() as cache:
+            _cache_put(cache, key, result)
+    return result
+
+def _run(fn, *args):
+    """Run an async RePORTER helper to completion, reusing one pooled client for every page."""
+    async def runner():
+        async with utils.new_client() as client:
+            return await fn(*args, client=client)
+    return asyncio.run(runner())
+
+def get_initial_response(search_params, include_fields, limit):
+    return _run(_cached, utils.get_initial_response, search_params, include_fields, limit)
+
+def get_all_responses(search_params, include_fields, limit):
+    return _run(_cached, utils.get_all_responses, search_params, include_fields, limit)
+
+def export_all_responses(path, search_params, include_fields, limit):
+    """
+    Write every page of results to a JSON file.
+
+    Pages are streamed to the file as they arrive instead of buffering the full response.
+    Unless --no-cache is given, each page is also cached on its own, and a run whose pages
+    are all still cached replays them from disk one at a time.
+    """
+    async def pages(client):
+        if not USE_CACHE:
+            async for page in utils.iter_pages(search_params, include_fields, limit, client=client):
+                yield page
+            return
+        # the entry under key holds the page count; the pages live under key#0, key#1, ...
+        key = _cache_key("iter_pages", search_params.to_api_criteria(), include_fields, limit)
+        with _open_cache() as cache:
+            count = _cache_get(cache, key)
+            if count is not None and all(_cache_fresh(cache, f"{key}#{n}") for n in range(count)):
+                for n in range(count):
+                    yield cache[f"{key}#{n}"]
+                return
+            count = 0
+            async for page in utils.iter_pages(search_params, include_fields, limit, client=client):
+                _cache_put(cache, f"{key}#{count}", page)
+                count += 1
+                yield page
+            _cache_put(cache, key, count)
+
+    async def export(client):
+        with open(path, 'wb') as f:
+            sep = None
+            async for page in pages(client):
+                if sep is None:
+                    f.write(b'{"meta":' + orjson.dumps(page['meta']) + b',"results":[')
+                    sep = b'\n'
+                for project in page['results']:
+                    f.write(sep + orjson.dumps(project))
+                    sep = b',\n'
+            f.write(b'\n]}\n')
+    _run(export)
+
 def term_search():
 
     # set query parameters
@@ -34,12 +155,8 @@ def term_search():
         print(f"Total results: {total}, refine search and try again to get detailed results")
         return
 
-    # get all responses
-    response = get_all_responses(search_params, include_fields, limit)
-
-    # export to JSON file 
-    with open('tests/test_responses/response.json', 'w') as f:
-        json.dump(response, f, indent=4)
+    # stream all responses to JSON file
+    export_all_responses('tests/test_responses/response.json', search_params, include_fields, limit)
 
 # term_search()
 
@@ -58,8 +175,8 @@ def funding_by_agency_search():
     response = get_all_responses(search_params, include_fields, limit)
 
     # export to JSON file 
-    with open('tests/test_responses/org_response.json', 'w') as f:
-        json.dump(response, f, indent=4)
+    with open('tests/test_responses/org_response.json', 'wb') as f:
+        f.write(orjson.dumps(response))
 
     print("Total Award Amount:", get_total_amount(response))
 
@@ -73,14 +190,28 @@ def get_project_details(project_num: str):
     limit = 10 
     include_fields = None 
 
-    response = get_all_responses(search_params, include_fields, limit)
-
-    # export to JSON file 
-    with open('tests/test_responses/project_details.json', 'w') as f:
-        json.dump(response, f, indent=4)
+    # stream all responses to JSON file
+    export_all_responses('tests/test_responses/project_details.json', search_params, include_fields, limit)
 
 # get_project_details("1R01MD013338-01")
 
+def get_project_details_batch(project_nums: list[str]):
+
+    # one request (plus pages) per batch instead of one per project number
+    records = {}
+    for i in range(0, len(project_nums), utils.MAX_BATCH_SIZE):
+        search_params = SearchParams(
+            project_nums=[ProjectNum(project_num=p) for p in project_nums[i:i + utils.MAX_BATCH_SIZE]]
+        )
+        response = get_all_responses(search_params, None, 500)
+
+        for project in response['results']:
+            records[project['project_num']] = project
+
+    return records
+
+# get_project_details_batch(["1R01MD013338-01", "1F32AG052995-01A1"])
+
 def get_all_projects():
     
     # set query parameters 
@@ -90,12 +221,8 @@ def get_all_projects():
     limit = 500
     include_fields = ["ProjectNum","Organization"]
 
-    # get all responses
-    response = get_all_responses(search_params, include_fields, limit)
-    
-    # Export to JSON file
-    with open('tests/test_responses/all_projects.json', 'w') as f:
-        json.dump(response, f, indent=4)
+    # stream all responses to JSON file
+    export_all_responses('tests/test_responses/all_projects.json', search_params, include_fields, limit)
     
 # get_all_projects()
 
@@ -107,10 +234,24 @@ def get_grants_for_opportunity_number(opp_num: str):
     limit = 500
     include_fields = None
 
-    response = get_all_responses(search_params, include_fields, limit)
+    # stream all responses to JSON file
+    export_all_responses('tests/test_responses/opp_num_response.json', search_params, include_fields, limit)
 
-    # export to JSON file 
-    with open('tests/test_responses/opp_num_response.json', 'w') as f:
-        json.dump(response, f, indent=4)
+def get_grants_for_opportunity_numbers(opp_nums: list[str]):
+
+    # one request (plus pages) per batch instead of one per opportunity number
+    grants = {opp_num: [] for opp_num in opp_nums}
+    for i in range(0, len(opp_nums), utils.MAX_BATCH_SIZE):
+        search_params = SearchParams(
+            opportunity_numbers=opp_nums[i:i + utils.MAX_BATCH_SIZE],
+        )
+        response = get_all_responses(search_params, None, 500)
+
+        for project in response['results']:
+            grants.setdefault(project['opportunity_number'], []).append(project)
+
+    return grants
+
+# get_grants_for_opportunity_numbers(["PAR-17-473", "PAR-21-293"])
 
 get_grants_for_opportunity_number("PAR-17-473")
\ No newline at end of file
@@ -1,11 +1,18 @@
 import os
+import orjson
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
 from reporter.tools import register_tools
 from reporter.prompts import register_prompts
 from reporter.routes import register_routes
+from reporter.utils import close_client
+
+def serialize_tool_result(data) -> str:
+    """Serialize tool results to compact JSON with orjson (integer keys such as fiscal years allowed)."""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 # Initialize FastMCP server
-mcp = FastMCP("reporter")
+mcp = FastMCP("reporter", tool_serializer=serialize_tool_result)
 
 # Register custom tools
 register_tools(mcp)
@@ -21,6 +28,20 @@ register_routes(mcp)
 #   Databricks: app.yaml               →  uvicorn ... --port $DATABRICKS_APP_PORT
 app = mcp.http_app(stateless_http=True)
 
+# Wrap the MCP session manager lifespan so the pooled NIH RePORTER client, created
+# lazily by utils.get_client() on the first request, is closed cleanly on shutdown.
+_mcp_lifespan = app.router.lifespan_context
+
+@asynccontextmanager
+async def lifespan(app):
+    async with _mcp_lifespan(app):
+        try:
+            yield
+        finally:
+            await close_client()
+
+app.router.lifespan_context = lifespan
+
 
 if __name__ == "__main__":
     # When run directly, check for a platform port env var.
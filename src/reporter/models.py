@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints, TypeAdapter, field_validator
 from enum import Enum 
-from typing import Optional, List
+from typing import Annotated, Final, Optional, List
 
 class NIHAgency(Enum): 
     CLC = "CLC"
@@ -37,45 +37,46 @@ class NIHAgency(Enum):
     @classmethod
     def get_full_name(cls, code: str) -> str:
         """Get the full name of an agency from its code"""
-        full_names = {
-            "CLC": "Clinical Center",
-            "CSR": "Center for Scientific Review",
-            "CIT": "Center for Information Technology",
-            "FIC": "John E. Fogarty International Center",
-            "NCATS": "National Center for Advancing Translational Sciences",
-            "NCCIH": "National Center for Complementary and Integrative Health",
-            "NCI": "National Cancer Institute",
-            "NCRR": "National Center for Research Resources",
-            "NEI": "National Eye Institute",
-            "NHGRI": "National Human Genome Research Institute",
-            "NHLBI": "National Heart, Lung, and Blood Institute",
-            "NIA": "National Institute on Aging",
-            "NIAAA": "National Institute on Alcohol Abuse and Alcoholism",
-            "NIAID": "National Institute of Allergy and Infectious Diseases",
-            "NIAMS": "National Institute of Arthritis and Musculoskeletal and Skin Diseases",
-            "NIBIB": "National Institute of Biomedical Imaging and Bioengineering",
-            "NICHD": "Eunice Kennedy Shriver National Institute of Child Health and Human Development",
-            "NIDA": "National Institute on Drug Abuse",
-            "NIDCD": "National Institute on Deafness and Other Communication Disorders",
-            "NIDCR": "National Institute of Dental and Craniofacial Research",
-            "NIDDK": "National Institute of Diabetes and Digestive and Kidney Diseases",
-            "NIEHS": "National Institute of Environmental Health Sciences",
-            "NIGMS": "National Institute of General Medical Sciences",
-            "NIH": "National Institutes of Health",
-            "NIMH": "National Institute of Mental Health",
-            "NIMHD": "National Institute on Minority Health and Health Disparities",
-            "NINDS": "National Institute of Neurological Disorders and Stroke",
-            "NINR": "National Institute of Nursing Research",
-            "NLM": "National Library of Medicine",
-            "OD": "Office of the Director"
-        }
-        return full_names.get(code, code)
+        return _AGENCY_FULL_NAMES.get(code, code)
     
     @property
     def full_name(self) -> str:
         """Get the full name of this agency"""
         return self.get_full_name(self.value)
 
+_AGENCY_FULL_NAMES: Final[dict[str, str]] = {
+    "CLC": "Clinical Center",
+    "CSR": "Center for Scientific Review",
+    "CIT": "Center for Information Technology",
+    "FIC": "John E. Fogarty International Center",
+    "NCATS": "National Center for Advancing Translational Sciences",
+    "NCCIH": "National Center for Complementary and Integrative Health",
+    "NCI": "National Cancer Institute",
+    "NCRR": "National Center for Research Resources",
+    "NEI": "National Eye Institute",
+    "NHGRI": "National Human Genome Research Institute",
+    "NHLBI": "National Heart, Lung, and Blood Institute",
+    "NIA": "National Institute on Aging",
+    "NIAAA": "National Institute on Alcohol Abuse and Alcoholism",
+    "NIAID": "National Institute of Allergy and Infectious Diseases",
+    "NIAMS": "National Institute of Arthritis and Musculoskeletal and Skin Diseases",
+    "NIBIB": "National Institute of Biomedical Imaging and Bioengineering",
+    "NICHD": "Eunice Kennedy Shriver National Institute of Child Health and Human Development",
+    "NIDA": "National Institute on Drug Abuse",
+    "NIDCD": "National Institute on Deafness and Other Communication Disorders",
+    "NIDCR": "National Institute of Dental and Craniofacial Research",
+    "NIDDK": "National Institute of Diabetes and Digestive and Kidney Diseases",
+    "NIEHS": "National Institute of Environmental Health Sciences",
+    "NIGMS": "National Institute of General Medical Sciences",
+    "NIH": "National Institutes of Health",
+    "NIMH": "National Institute of Mental Health",
+    "NIMHD": "National Institute on Minority Health and Health Disparities",
+    "NINDS": "National Institute of Neurological Disorders and Stroke",
+    "NINR": "National Institute of Nursing Research",
+    "NLM": "National Library of Medicine",
+    "OD": "Office of the Director"
+}
+
 class SearchOperator(str, Enum):
     """How to combine multiple search terms."""
     ALL = "all"
@@ -85,12 +86,14 @@ class SearchOperator(str, Enum):
 
     @property
     def description(self) -> str:
-        return {
-            "all": "for searching text in all search fields (title, abstract, scientific terms)",
-            "or": "projects that contain at least one of the terms entered will be retrieved. Use quotes(\") around the entered text to search for exact phrases",
-            "and": "projects in which all of the search terms are found within the title, abstract, or scientific terms will be retrieved",
-            "advanced": "provides additional capability to narrow selection criteria more precisely and evaluate complex entries such as chemical references",
-        }[self.value]
+        return _OPERATOR_DESCRIPTIONS[self.value]
+
+_OPERATOR_DESCRIPTIONS: Final[dict[str, str]] = {
+    "all": "for searching text in all search fields (title, abstract, scientific terms)",
+    "or": "projects that contain at least one of the terms entered will be retrieved. Use quotes(\") around the entered text to search for exact phrases",
+    "and": "projects in which all of the search terms are found within the title, abstract, or scientific terms will be retrieved",
+    "advanced": "provides additional capability to narrow selection criteria more precisely and evaluate complex entries such as chemical references",
+}
 
 class SearchField(str, Enum):
     """Fields to search in."""
@@ -100,18 +103,42 @@ class SearchField(str, Enum):
 
     @property
     def description(self) -> str:
-        return {
-            "projecttitle": "Search within project titles.",
-            "terms": "Search indexed NIH RePORTER terms.",
-            "abstract": "Search within project abstracts.",
-        }[self.value]
+        return _FIELD_DESCRIPTIONS[self.value]
+
+_FIELD_DESCRIPTIONS: Final[dict[str, str]] = {
+    "projecttitle": "Search within project titles.",
+    "terms": "Search indexed NIH RePORTER terms.",
+    "abstract": "Search within project abstracts.",
+}
+
+_SEARCH_FIELD_BY_VALUE = {f.value: f for f in SearchField}
+
+def _coerce_search_fields(v):
+    """Allow a single string or a list of strings/enums; normalize to a list of SearchField."""
+    if isinstance(v, str):
+        v = [v]  # single string -> list
+    if not isinstance(v, (list, tuple)):
+        return v  # let pydantic report the type error
+    out = []
+    for f in v:
+        if isinstance(f, SearchField):
+            out.append(f)
+            continue
+        # match string to enum value
+        matched = _SEARCH_FIELD_BY_VALUE.get(str(f).lower())
+        if matched is None:
+            raise ValueError(f"Invalid search_field '{f}'. Valid options: {list(_SEARCH_FIELD_BY_VALUE)}")
+        out.append(matched)
+    return out
 
 class AdvancedTextSearch(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     operator: SearchOperator = Field(
         default=SearchOperator.AND,
         description="How to combine multiple search terms (defaults to AND)"
     )
-    search_field: List[SearchField] = Field(
+    search_field: Annotated[List[SearchField], BeforeValidator(_coerce_search_fields)] = Field(
         default=[SearchField.PROJECT_TITLE, SearchField.ABSTRACT, SearchField.TERMS],
         description=(
             "One or more fields to search within. Choose any combination of: "
@@ -124,51 +151,23 @@ class AdvancedTextSearch(BaseModel):
         description="Text to search for"
     )
 
-    @field_validator("search_field", mode="before")
-    def coerce_fields(cls, v):
-        """Allow lists of strings or enums; convert everything to list of SearchField if possible."""
-        if isinstance(v, str):
-            v = [v]  # single string -> list
-        if isinstance(v, list):
-            out = []
-            for f in v:
-                if isinstance(f, SearchField):
-                    out.append(f)
-                elif isinstance(f, str):
-                    f_lower = f.lower()
-                    # match string to enum value
-                    for field in SearchField:
-                        if f_lower == field.value:
-                            out.append(field)
-                            break
-                    else:
-                        # leave as plain string if not matched
-                        out.append(f)
-                else:
-                    out.append(f)
-            return out
-        return v
+# Loose grammar for project numbers (e.g. "1F32AG052995-01A1"): letters, digits and dashes,
+# plus the "*" wildcard RePORTER accepts for partial numbers (e.g. "5UG1HD078437-*")
+_PROJECT_NUM_PATTERN: Final[str] = r"^[0-9A-Za-z][0-9A-Za-z\-*]+$"
 
 class ProjectNum(BaseModel):
-    project_num: str = Field(
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    # Stripped, checked and uppercased by pydantic-core, so malformed IDs fail before any API call
+    project_num: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, to_upper=True, pattern=_PROJECT_NUM_PATTERN)
+    ] = Field(
         ..., 
-        description="Unique project identifier assigned by NIH RePORTER",
-        min_length=1,
-        examples=["1F32AG052995-01A1", "7R01DA034777-04", "1F32DK109635-01A1"]
+        description="Unique project identifier assigned by NIH RePORTER; use * as a wildcard to match partial numbers",
+        examples=["1F32AG052995-01A1", "7R01DA034777-04", "1F32DK109635-01A1", "5UG1HD078437-*"]
     )
 
-    @field_validator('project_num')
-    @classmethod
-    def validate_project_num(cls, v: str) -> str:
-        # Remove any whitespace
-        v = v.strip()
-        
-        # This is a loose check since formats can vary
-        if not v:
-            raise ValueError("Project number cannot be empty")
-        
-        return v.upper()  # Normalize to uppercase
-
 class StateCode(str, Enum):
     AL = "AL"
     AK = "AK"
@@ -313,6 +312,9 @@ class IncludeField(str, Enum):
     # Other
     PROJECT_DETAIL_URL = "ProjectDetailUrl"
 
+_INCLUDE_FIELD_BY_NAME = {f.name: f for f in IncludeField}
+_INCLUDE_FIELD_BY_VALUE = {f.value: f for f in IncludeField}
+
 
 class IncludeFields(BaseModel):
     """Validates and converts a list of field name strings to IncludeField enum members."""
@@ -329,11 +331,7 @@ class IncludeFields(BaseModel):
                 if isinstance(f, IncludeField):
                     out.append(f)
                 elif isinstance(f, str):
-                    matched = None
-                    for field in IncludeField:
-                        if f.upper() == field.name or f == field.value:
-                            matched = field
-                            break
+                    matched = _INCLUDE_FIELD_BY_NAME.get(f.upper()) or _INCLUDE_FIELD_BY_VALUE.get(f)
                     if matched:
                         out.append(matched)
                     else:
@@ -364,6 +362,8 @@ class POName(BaseModel):
 
 
 class SearchParams(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     # optional filters
     advanced_text_search: Optional[AdvancedTextSearch] = Field(None, description="text search string and search parameters")
     years: Optional[List[int]] = Field(None, description="List of fiscal years where projects are active (e.g. [2023, 2024])")
@@ -381,36 +381,24 @@ class SearchParams(BaseModel):
     def to_api_criteria(self):
         """Convert to API criteria format"""
         criteria = {}
-        
+
         # Add advanced text search if provided
         if self.advanced_text_search:
             ats = self.advanced_text_search
-            sf = ats.search_field
-
-            # Normalize to the comma-separated string the API expects
-            if isinstance(sf, list):
-                search_field_str = ", ".join(
-                    s.value if isinstance(s, SearchField) else str(s) for s in sf
-                )
-            elif isinstance(sf, SearchField):
-                search_field_str = sf.value
-            else:
-                # Already a string (or something else) — use as-is
-                search_field_str = str(sf)
-
             criteria["advanced_text_search"] = {
                 "search_text": ats.search_text,
-                "search_field": search_field_str,
+                # Normalize to the comma-separated string the API expects
+                "search_field": ", ".join(s.value for s in ats.search_field),
                 "operator": ats.operator.value
             }
 
         # Add other filters
         if self.years:
-            criteria["fiscal_years"] = self.years
+            criteria["fiscal_years"] = list(self.years)
         if self.agencies:
-            criteria["agencies"] = [a.value if hasattr(a, 'value') else a for a in self.agencies]
+            criteria["agencies"] = [a.value for a in self.agencies]
         if self.organizations:
-            criteria["org_names"] = self.organizations
+            criteria["org_names"] = list(self.organizations)
         if self.pi_name:
             criteria["pi_names"] = [{"any_name": self.pi_name}]
         if self.po_names:
@@ -421,16 +409,18 @@ class SearchParams(BaseModel):
         if self.project_nums:
             criteria["project_nums"] = [a.project_num for a in self.project_nums]
         if self.org_states:
-            criteria["org_states"] = [a.value if hasattr(a, 'value') else a for a in self.org_states]
+            criteria["org_states"] = [a.value for a in self.org_states]
         if self.opportunity_numbers:
-            criteria["opportunity_numbers"] = self.opportunity_numbers
+            criteria["opportunity_numbers"] = list(self.opportunity_numbers)
         if self.activity_codes:
-            criteria["activity_codes"] = self.activity_codes
+            criteria["activity_codes"] = list(self.activity_codes)
         if self.funding_mechanisms:
-            criteria["funding_mechanisms"] = [a.value if hasattr(a, 'value') else a for a in self.funding_mechanisms]
+            criteria["funding_mechanisms"] = [a.value for a in self.funding_mechanisms]
         if self.award_types:
-            criteria["award_types"] = [a.value if hasattr(a, 'value') else a for a in self.award_types]
+            criteria["award_types"] = [a.value for a in self.award_types]
 
         return criteria
-    
 
+
+# Reusable validator for building SearchParams from raw dicts
+SEARCH_PARAMS_ADAPTER = TypeAdapter(SearchParams)
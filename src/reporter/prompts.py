@@ -1,10 +1,5 @@
-def register_prompts(mcp):
-
-    @mcp.prompt()
-    def project_information_search() -> str:
-        """Use this prompt to answer questions about the information of NIH-funded research projects."""
-
-        return f"""Please help me do a summary analysis of NIH research grants. Follow these steps:
+# Static prompt text, built once at import rather than on every prompt request
+_PROJECT_INFO_SEARCH_PROMPT = """Please help me do a summary analysis of NIH research grants. Follow these steps:
 
             1. Start with search_projects to get a quick preview of matching projects (samples first 500)
                - Returns total count and distributions (year, institute, activity code, organization, funding mechanism, active status, award stats)
@@ -29,6 +24,14 @@ def register_prompts(mcp):
 
             5. Use the returned information to answer the user's question."""
 
+def register_prompts(mcp):
+
+    @mcp.prompt()
+    def project_information_search() -> str:
+        """Use this prompt to answer questions about the information of NIH-funded research projects."""
+
+        return _PROJECT_INFO_SEARCH_PROMPT
+
     @mcp.prompt()
     def rcdc_term_frequency(
         rcdc_terms: str,
@@ -1,10 +1,18 @@
+import orjson
 from fastmcp import FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 def register_routes(mcp: FastMCP) -> None:
 
     # Health check endpoint
     @mcp.custom_route("/health", methods=["GET"])
-    async def health_check(request: Request) -> JSONResponse:
-        return JSONResponse({"status": "healthy", "service": "nih-reporter-mcp-server"})
\ No newline at end of file
+    async def health_check(request: Request) -> ORJSONResponse:
+        return ORJSONResponse({"status": "healthy", "service": "nih-reporter-mcp-server"})
\ No newline at end of file
@@ -1,8 +1,38 @@
+import asyncio
+from itertools import chain
 from typing import List
-from reporter.utils import get_all_responses, get_initial_response, get_project_distributions, build_crosstab, DIMENSION_FIELDS
-from reporter.models import SearchParams, ProjectNum, IncludeField, IncludeFields
+from reporter.utils import get_all_responses, get_all_distributions, get_initial_response, get_project_distributions, build_crosstab, DIMENSION_FIELDS, MAX_BATCH_SIZE, MAX_CONCURRENT_PAGES
+from reporter.models import SearchParams, SEARCH_PARAMS_ADAPTER, IncludeField, IncludeFields
 from fastmcp import Context
 
+def _format_distributions(distributions, *, include_details=True):
+    """
+    Format the output of get_project_distributions for a tool response.
+
+    Args:
+        distributions (dict): Output of get_project_distributions
+        include_details (bool): Also include the organization, funding mechanism,
+            active status and award amount breakdowns
+
+    Returns:
+        dict: Year distribution (newest first) and the top institutes and activity codes,
+            plus the detailed breakdowns if requested
+    """
+    year_dist = distributions["year_distribution"]
+    formatted = {
+        "year_distribution": {y: year_dist[y] for y in sorted(year_dist, reverse=True)},
+        "institute_distribution": dict(distributions["institute_distribution"].most_common(15)),
+        "activity_code_distribution": dict(distributions["activity_code_distribution"].most_common(15)),
+    }
+    if include_details:
+        formatted.update({
+            "organization_distribution": dict(distributions["organization_distribution"].most_common(15)),
+            "funding_mechanism_distribution": dict(distributions["funding_mechanism_distribution"].most_common(20)),
+            "active_status_distribution": dict(distributions["active_status_distribution"]),
+            "award_amount_stats": distributions["award_amount_stats"],
+        })
+    return formatted
+
 def register_tools(mcp):
     @mcp.tool()
     async def search_projects(
@@ -54,13 +84,7 @@ def register_tools(mcp):
 
         return {
             "total_projects": total_projects,
-            "year_distribution": dict(sorted(distributions["year_distribution"].items(), reverse=True)),
-            "institute_distribution": dict(distributions["institute_distribution"].most_common(15)),
-            "activity_code_distribution": dict(distributions["activity_code_distribution"].most_common(15)),
-            "organization_distribution": dict(distributions["organization_distribution"].most_common(15)),
-            "funding_mechanism_distribution": dict(distributions["funding_mechanism_distribution"].most_common()),
-            "active_status_distribution": dict(distributions["active_status_distribution"]),
-            "award_amount_stats": distributions["award_amount_stats"],
+            **_format_distributions(distributions),
         }
 
     @mcp.tool()
@@ -104,24 +128,16 @@ def register_tools(mcp):
             IncludeField.AWARD_AMOUNT.value,
         ]
 
-        # Fetch ALL results (pages through entire result set)
-        all_results = await get_all_responses(
+        # Summarize ALL results (pages through entire result set without keeping the rows)
+        distributions = await get_all_distributions(
             search_params,
             include_fields,
         )
-
-        distributions = get_project_distributions(all_results)
-        total_projects = len(distributions["project_ids"])
+        total_projects = distributions["project_count"]
 
         return {
             "total_projects": total_projects,
-            "year_distribution": dict(sorted(distributions["year_distribution"].items(), reverse=True)),
-            "institute_distribution": dict(distributions["institute_distribution"].most_common(15)),
-            "activity_code_distribution": dict(distributions["activity_code_distribution"].most_common(15)),
-            "organization_distribution": dict(distributions["organization_distribution"].most_common(15)),
-            "funding_mechanism_distribution": dict(distributions["funding_mechanism_distribution"].most_common()),
-            "active_status_distribution": dict(distributions["active_status_distribution"]),
-            "award_amount_stats": distributions["award_amount_stats"],
+            **_format_distributions(distributions),
         }
 
     @mcp.tool()
@@ -143,7 +159,7 @@ def register_tools(mcp):
             dict: API response containing:
             - total_projects: Total number of matching projects in database
             - returned_projects: Number of project IDs returned (max 500)
-            - project_ids: List of project ID numbers
+            - project_ids: List of project ID numbers (e.g. ["1F32AG052995-01A1"]), which can be passed to get_project_information
             - year_distribution: Breakdown of projects by fiscal year
             - institute_distribution: Breakdown by NIH institute/center
             - activity_code_distribution: Breakdown by activity code (grant type)
@@ -166,16 +182,14 @@ def register_tools(mcp):
             limit
         )
 
-        distributions = get_project_distributions(all_results)
+        distributions = get_project_distributions(all_results, need_project_ids=True)
         project_ids = distributions["project_ids"]
 
         return {
             "total_projects": total_projects,
             "returned_projects": len(project_ids),
             "project_ids": project_ids,
-            "year_distribution": dict(sorted(distributions["year_distribution"].items(), reverse=True)),
-            "institute_distribution": dict(distributions["institute_distribution"].most_common(15)),
-            "activity_code_distribution": dict(distributions["activity_code_distribution"].most_common(15)),
+            **_format_distributions(distributions, include_details=False),
             "has_more_results": total_projects > len(project_ids),
         }
         
@@ -198,16 +212,43 @@ def register_tools(mcp):
             dict: API response with specified project metadata
         """
 
-        # add project_ids to a search_params object
-        search_params = SearchParams(
-            project_nums=[ProjectNum(project_num=p) for p in project_ids]
-        )
+        # with no project_nums filter the search would match every NIH project
+        if not project_ids:
+            return {"meta": {"total": 0}, "results": []}
+
+        # add project_ids to search_params objects, one per batch the API can return in a page
+        batches = [
+            SEARCH_PARAMS_ADAPTER.validate_python(
+                {"project_nums": [{"project_num": p} for p in project_ids[i:i + MAX_BATCH_SIZE]]}
+            )
+            for i in range(0, len(project_ids), MAX_BATCH_SIZE)
+        ]
 
         # Validate and convert include_fields strings to IncludeField enum values
         fields = IncludeFields(fields=include_fields)
+        field_values = [f.value for f in fields.fields]
+
+        # Call the API, fetching the batches concurrently; the task group cancels the
+        # remaining batches if one fails so they don't keep paging in the background
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        async def fetch_batch(search_params):
+            async with semaphore:
+                return await get_all_responses(search_params, field_values)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(fetch_batch(b)) for b in batches]
+        except ExceptionGroup as e:
+            # surface the API error itself, as a single gather() call would
+            raise e.exceptions[0] from None
+        responses = [task.result() for task in tasks]
+
+        all_results = responses[0]
+        all_results['meta']['total'] = sum(r['meta']['total'] for r in responses)
+        all_results['results'] = list(chain.from_iterable(r['results'] for r in responses))
 
-        # Call the API
-        return await get_all_responses(search_params, [f.value for f in fields.fields])
+        return all_results
 
     @mcp.tool()
     async def get_portfolio_crosstab(
@@ -1,5 +1,12 @@
-import requests
 import asyncio
+import os
+import random
+import time
+import httpx
+import orjson
+from collections import Counter, OrderedDict, defaultdict, deque
+from itertools import chain, islice
+from operator import itemgetter
 from reporter.models import SearchParams, IncludeField
 from fastmcp import Context
 
@@ -16,33 +23,132 @@ DIMENSION_FIELDS = {
     "award_type":        IncludeField.AWARD_TYPE,
 }
 
-def clean_json(response):
+# NIH Reporter API endpoint
+REPORTER_API_URL = "https://api.reporter.nih.gov/v2/projects/search"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Pulls the name out of each principal investigator record in clean_json
+_get_full_name = itemgetter("full_name")
+
+# Unbound dict.get for hot loops over result rows; skips a bound-method lookup per row
+_dget = dict.get
+
+# Largest page the API will return; used as the default limit so paging takes as few round-trips as possible
+MAX_PAGE_SIZE = 500
+
+# Maximum number of page requests in flight at once when paginating
+MAX_CONCURRENT_PAGES = 8
+
+# Concurrent paging can trip the API's rate limit, so rate-limited (429), server
+# error (5xx) and connection failures are retried with exponential backoff and
+# jitter before a request is given up on
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+# Maximum number of values (e.g. project numbers) to send in a single criteria list;
+# the API caps page size at 500, so larger batches are split across requests
+MAX_BATCH_SIZE = MAX_PAGE_SIZE
+
+# Raw response bodies keyed on the canonical request payload. RePORTER data is
+# stable within a session, so repeated identical queries (common during eval runs)
+# skip the network. Bounded by entry count and total bytes to keep worker memory low,
+# and entries expire after RESPONSE_CACHE_TTL seconds so long-lived servers pick up
+# nightly data refreshes. The byte budget is per worker process (manifest.yaml runs
+# two workers in one 256M instance) and can be changed with RESPONSE_CACHE_MAX_BYTES.
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+RESPONSE_CACHE_TTL = 300
+_response_cache = OrderedDict()
+_response_cache_bytes = 0
+
+# Requests currently on the wire, keyed like the cache, so identical concurrent
+# queries share one round-trip instead of racing to fill the same cache entry
+_inflight = {}
+
+class _InflightRequest:
+    """A request shared by concurrent identical searches, and how many callers await it."""
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future):
+        self.future = future
+        self.waiters = 0
+
+# Shared client so paginated requests reuse one warm keep-alive connection instead
+# of paying a TCP+TLS handshake per page. Created lazily so it binds to the running
+# event loop; the ASGI lifespan in app.py closes it on shutdown.
+_client = None
+
+def new_client():
+    """
+    Create an HTTP client configured for the NIH RePORTER API.
+
+    Returns:
+        httpx.AsyncClient: Client with HTTP/2, connection pooling and a 30s timeout
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=30.0,
+    )
+
+def get_client():
+    """
+    Return the shared NIH RePORTER client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: Shared pooled client
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = new_client()
+    return _client
+
+async def close_client():
+    """Close the shared NIH RePORTER client if it has been created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def clean_json(response, include_fields=None):
     """
     Cleans JSON response by simplyfing fields with subfields. 
 
     Args: 
         response (dict): JSON response from the NIH RePORTER API
+        include_fields (list[str], optional): Fields the request asked for. Only those
+            fields are cleaned; if omitted, every field is assumed to be present.
 
     Returns: 
         dict: Cleaned JSON response
     """
 
+    # fields that weren't requested aren't in the results, so skip their cleaning
+    fields = set(include_fields) if include_fields else None
+    has_org = fields is None or IncludeField.ORGANIZATION.value in fields
+    has_agency = fields is None or IncludeField.AGENCY_IC_ADMIN.value in fields
+    has_pi = fields is None or IncludeField.PRINCIPAL_INVESTIGATORS.value in fields
+
+    if not (has_org or has_agency or has_pi):
+        return response
+
     # simply JSON response 
     for project in response.get('results', []):
         
         # keep only the organization name and the state
-        if project.get('organization'):
+        if has_org and project.get('organization'):
             project['org_name'] = project['organization']['org_name']
             project['org_state'] = project['organization']['org_state']
             del project['organization']
         
         # keep only the first part of the agency name
-        if project.get('agency_ic_admin'):
+        if has_agency and project.get('agency_ic_admin'):
             project['agency_ic_admin'] = project['agency_ic_admin']['abbreviation']
 
         # create list of principal investigators full names
-        if project.get('principal_investigators'):
-            project['principal_investigators'] = [pi['full_name'] for pi in project['principal_investigators']]
+        if has_pi and project.get('principal_investigators'):
+            project['principal_investigators'] = list(map(_get_full_name, project['principal_investigators']))
 
     return response 
 
@@ -64,50 +170,135 @@ def get_total_amount(response):
     
     return str(total_amount)
 
-async def search_nih_reporter(payload):
+def clear_cache():
+    """Drop all cached NIH RePORTER responses."""
+    global _response_cache_bytes
+    _response_cache.clear()
+    _response_cache_bytes = 0
+
+def _cached_response(key):
+    """Return a cached response body, or None if it is missing or has expired."""
+    global _response_cache_bytes
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, body = entry
+    if expires_at <= time.monotonic():
+        del _response_cache[key]
+        _response_cache_bytes -= len(body)
+        return None
+    _response_cache.move_to_end(key)
+    return body
+
+def _cache_response(key, body):
+    """Store a response body in the LRU cache, evicting the oldest entries when over budget."""
+    global _response_cache_bytes
+    if len(body) > RESPONSE_CACHE_MAX_BYTES:
+        return
+    previous = _response_cache.pop(key, None)
+    if previous is not None:
+        _response_cache_bytes -= len(previous[1])
+    _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, body)
+    _response_cache_bytes += len(body)
+    while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES or _response_cache_bytes > RESPONSE_CACHE_MAX_BYTES:
+        _, (_, evicted) = _response_cache.popitem(last=False)
+        _response_cache_bytes -= len(evicted)
+
+def _is_retryable(error):
+    """Whether a failed request is worth retrying: rate limits, server errors and dropped connections."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+def _retry_delay(attempt):
+    """Seconds to wait before retrying after the given (1-based) failed attempt."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    # jitter so concurrent page requests don't all retry at the same moment
+    return random.uniform(delay / 2, delay)
+
+async def _fetch(key, client):
+    """POST an encoded search payload, retrying transient failures, and cache the raw response body."""
+    if client is None:
+        client = get_client()
+
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            # the cache key is already the payload encoded as JSON, so send it as is
+            response = await client.post(REPORTER_API_URL, content=key, headers=JSON_HEADERS)
+            response.raise_for_status()  # Raise an exception for bad status codes
+            break
+        
+        except httpx.HTTPError as e:
+            if attempt == MAX_ATTEMPTS or not _is_retryable(e):
+                raise Exception(f"NIH RePORTER API request failed: {e}")
+
+        await asyncio.sleep(_retry_delay(attempt))
+
+    body = response.content
+    _cache_response(key, body)
+    return body
+
+async def search_nih_reporter(payload, client=None):
     """
     Search NIH Reporter API for grant information
     
     Args:
         payload (dict): Search criteria
+        client (httpx.AsyncClient, optional): Client to send the request with. Defaults to the shared client.
     
     Returns:
         dict: API response containing grant data
     """
     
-    # NIH Reporter API endpoint
-    url = "https://api.reporter.nih.gov/v2/projects/search"
-    
+    # Searches are read-only, so identical payloads can be served from the cache.
+    # Bodies are cached as bytes and parsed per call, so callers get fresh objects.
+    key = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    body = _cached_response(key)
+    if body is not None:
+        return orjson.loads(body)
+
+    request = _inflight.get(key)
+    if request is None:
+        request = _InflightRequest(asyncio.ensure_future(_fetch(key, client)))
+        _inflight[key] = request
+        # a cancelled request may finish after a newer one took its key, so only drop our own entry
+        request.future.add_done_callback(lambda _, r=request: _inflight.get(key) is r and _inflight.pop(key))
+
+    # shield so one caller giving up doesn't cancel the request for the others,
+    # but cancel it once nobody is left waiting so it stops retrying in the background.
+    # cancel() only takes effect on the next loop step, so unregister the request now
+    # to keep identical searches arriving in between from joining it.
+    request.waiters += 1
     try:
-        # Run the synchronous requests call in a thread pool
-        response = await asyncio.to_thread(
-            requests.post, 
-            url, 
-            json=payload,
-            headers={'Content-Type': 'application/json'}
-        )
-        response.raise_for_status()  # Raise an exception for bad status codes
-        
-        return response.json()
-    
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"NIH RePORTER API request failed: {e}")
+        body = await asyncio.shield(request.future)
+    finally:
+        request.waiters -= 1
+        if request.waiters == 0 and not request.future.done():
+            request.future.cancel()
+            if _inflight.get(key) is request:
+                del _inflight[key]
+
+    return orjson.loads(body)
     
-async def paged_query(search_params:SearchParams, include_fields: list[str], limit=100, offset=0, all_results=None):
+async def paged_query(search_params:SearchParams, include_fields: list[str], limit=MAX_PAGE_SIZE, offset=0, client=None, criteria=None):
     """
-    Perform the initial query to get the total number of projects matching the criteria.
+    Fetch a single page of projects matching the criteria.
     
     Args:
         search_params (SearchParams): Search parameters including years, agencies, organizations, and pi_name.
         limit (int): Number of results to return per request (max 500).
         offset (int): Offset for pagination.
+        client (httpx.AsyncClient, optional): Client to send the request with. Defaults to the shared client.
+        criteria (dict, optional): search_params.to_api_criteria(), if already computed. Pass it
+            when fetching several pages of the same search so it is only built once.
         
     Returns:
-        dict: API response containing grant data
+        tuple: Total number of matching projects, and the cleaned API response for this page
     """
     
     payload = {
-        "criteria": search_params.to_api_criteria(),
+        "criteria": criteria if criteria is not None else search_params.to_api_criteria(),
         "offset": offset,
         "limit": limit,
         "include_fields": include_fields,
@@ -115,50 +306,95 @@ async def paged_query(search_params:SearchParams, include_fields: list[str], lim
         "sort_order": "desc"
     }
 
-    response = await search_nih_reporter(payload)
+    response = await search_nih_reporter(payload, client)
 
     if response is None:
         raise Exception("NIH RePORTER API request failed - no response received")
 
-    response = clean_json(response)
+    response = clean_json(response, include_fields)
 
     total_responses = response['meta']['total']
-    
-    # if initial call, create empty list to collect results
-    if all_results is None:
-        all_results = {
-            'meta': response['meta'],
-            'results': []
-        }
-
-    # Collect results from first request
-    all_results['results'].extend(response.get('results', []))
+    response.setdefault('results', [])
 
-    return total_responses, all_results
+    return total_responses, response
 
-async def get_initial_response(search_params:SearchParams, include_fields: list[str], limit=100):
+async def get_initial_response(search_params:SearchParams, include_fields: list[str], limit=MAX_PAGE_SIZE, client=None):
     
     offset = 0 
-    total_responses, all_results = await paged_query(search_params, include_fields, limit, offset)
+    total_responses, all_results = await paged_query(search_params, include_fields, limit, offset, client=client)
 
     return total_responses, all_results
 
-async def get_all_responses(search_params:SearchParams, include_fields: list[str], limit=500):
+async def iter_pages(search_params:SearchParams, include_fields: list[str], limit=MAX_PAGE_SIZE, client=None):
+    """
+    Yield each page of results matching the search criteria, in offset order.
+
+    Pages after the first are fetched concurrently, but each one is handed to the
+    caller as soon as it is next in line, so rows can be aggregated or written out
+    without holding the full result set in memory.
 
-    offset = 0 
-    total_responses, all_results = await paged_query(search_params, include_fields, limit, offset)
+    Args:
+        search_params (SearchParams): Search parameters including years, agencies, organizations, and pi_name.
+        include_fields (list[str]): Fields to return from the API.
+        limit (int): Number of results to return per request (max 500).
+        client (httpx.AsyncClient, optional): Client to send the requests with. Defaults to the shared client.
+
+    Yields:
+        dict: Cleaned API response for a single page
+    """
+
+    # every page shares the same criteria, so build them once
+    criteria = search_params.to_api_criteria()
+
+    total_responses, first_page = await paged_query(search_params, include_fields, limit, 0, client=client, criteria=criteria)
 
     print(f"Total results: {total_responses}")
-    
 
-    # Loop through remaining pages
-    while offset + limit < total_responses:
-        offset += limit
+    yield first_page
+    del first_page
+
+    # The first response reveals the total, so the remaining offsets are known up
+    # front and can be fetched concurrently over the pooled connection. Only a window
+    # of MAX_CONCURRENT_PAGES pages is requested ahead of the caller, and each task is
+    # dropped once its page is handed over, so consumed pages can be freed.
+    async def fetch_page(offset):
         print(f"Fetching results {offset} to {offset + limit}...")
-        
-        total_responses, all_results = await paged_query(search_params, include_fields, limit, offset, all_results)
+        _, page = await paged_query(search_params, include_fields, limit, offset, client=client, criteria=criteria)
+        return page
+
+    offsets = iter(range(limit, total_responses, limit))
+    pending = deque()
+
+    def schedule():
+        for offset in islice(offsets, MAX_CONCURRENT_PAGES - len(pending)):
+            pending.append(asyncio.create_task(fetch_page(offset)))
+
+    try:
+        schedule()
+        while pending:
+            page = await pending.popleft()
+            schedule()
+            yield page
+            del page
+    finally:
+        # don't leave requests running if the caller stops early or a page fails;
+        # a page's request is only kept alive if another search is awaiting it too
+        for task in pending:
+            task.cancel()
+
+async def get_all_responses(search_params:SearchParams, include_fields: list[str], limit=MAX_PAGE_SIZE, client=None):
+
+    all_results = None
+    pages = []
+    async for page in iter_pages(search_params, include_fields, limit, client):
+        if all_results is None:
+            all_results = page
+        pages.append(page['results'])
+
+    # concatenate once at the end rather than growing the list page by page
+    all_results['results'] = list(chain.from_iterable(pages))
     
-    print(f"Retrieved {len(all_results)} total results")
+    print(f"Retrieved {len(all_results['results'])} total results")
 
     return all_results
 
@@ -174,8 +410,6 @@ def build_crosstab(all_results, row_field, col_field):
     Returns:
         dict: Nested dict of {row: {col: {"count": N, "total_funding": X}}}, sorted by row.
     """
-    from collections import defaultdict
-
     crosstab = defaultdict(lambda: defaultdict(lambda: {"count": 0, "total_funding": 0}))
 
     for r in all_results.get("results", []):
@@ -190,16 +424,165 @@ def build_crosstab(all_results, row_field, col_field):
     return {row: dict(cols) for row, cols in sorted(crosstab.items(), key=lambda x: str(x[0]))}
 
 
-def get_project_distributions(all_results):
+class DistributionAccumulator:
+    """
+    Incrementally build the distributions reported by get_project_distributions.
+
+    Results can be fed in page by page with update(), so a full result set can be
+    summarized without keeping every row in memory. finalize() returns the same
+    dict as get_project_distributions.
+    """
+
+    def __init__(self, need_project_ids=False):
+        self.need_project_ids = need_project_ids
+        self.project_ids = []
+        self.project_count = 0
+        self.year_dist = Counter()
+        self.ic_dist = Counter()
+        self.activity_dist = Counter()
+        self.org_dist = Counter()
+        self.funding_mech_dist = Counter()
+        self.active_dist = Counter()
+        self.award_total = 0
+        self.award_min = None
+        self.award_max = None
+        self.award_count = 0
+
+    def update(self, results):
+        """
+        Fold a list of results (e.g. one page) into the running distributions.
+
+        Args:
+            results (list): Results from a cleaned API response
+        """
+
+        # Columns are gathered first and counted in bulk, which keeps Counter on its C fast path
+        dget = _dget
+        need_project_ids = self.need_project_ids
+        project_ids = self.project_ids
+        project_count = 0
+        fiscal_years = []
+        ics = []
+        activity_codes = []
+        org_names = []
+        funding_mechanisms = []
+        active_statuses = []
+        award_total = 0
+        award_min = self.award_min
+        award_max = self.award_max
+        award_count = 0
+
+        # Extract every column in one pass over the results,
+        # skipping entries that aren't dicts (individual results might be strings)
+        for r in results:
+            if not isinstance(r, dict):
+                continue
+
+            project_num = dget(r, "project_num")
+            if project_num:
+                project_count += 1
+                if need_project_ids:
+                    project_ids.append(project_num)
+
+            fiscal_year = dget(r, "fiscal_year")
+            if fiscal_year:
+                fiscal_years.append(fiscal_year)
+
+            # Institute/Center
+            ic = dget(r, "agency_ic_admin")
+            if ic:
+                ics.append(ic)
+
+            activity_code = dget(r, "activity_code")
+            if activity_code:
+                activity_codes.append(activity_code)
+
+            # Organization (uses org_name from clean_json)
+            org_name = dget(r, "org_name")
+            if org_name:
+                org_names.append(org_name)
+
+            funding_mechanism = dget(r, "funding_mechanism")
+            if funding_mechanism:
+                funding_mechanisms.append(funding_mechanism)
+
+            is_active = dget(r, "is_active")
+            if is_active is not None:
+                active_statuses.append("Active" if is_active else "Inactive")
+
+            # Award amount statistics, tracked as running values
+            award_amount = dget(r, "award_amount")
+            if award_amount is not None:
+                award_total += award_amount
+                award_count += 1
+                if award_min is None or award_amount < award_min:
+                    award_min = award_amount
+                if award_max is None or award_amount > award_max:
+                    award_max = award_amount
+
+        self.project_count += project_count
+        self.year_dist.update(fiscal_years)
+        self.ic_dist.update(ics)
+        self.activity_dist.update(activity_codes)
+        self.org_dist.update(org_names)
+        self.funding_mech_dist.update(funding_mechanisms)
+        self.active_dist.update(active_statuses)
+        self.award_total += award_total
+        self.award_min = award_min
+        self.award_max = award_max
+        self.award_count += award_count
+
+    def finalize(self):
+        """
+        Return the accumulated distributions.
+
+        Returns:
+            dict: Same structure as get_project_distributions
+        """
+
+        if self.award_count:
+            award_stats = {
+                "total": self.award_total,
+                "average": self.award_total / self.award_count,
+                "min": self.award_min,
+                "max": self.award_max,
+                "count": self.award_count
+            }
+        else:
+            award_stats = {
+                "total": 0,
+                "average": 0,
+                "min": 0,
+                "max": 0,
+                "count": 0
+            }
+
+        return {
+            "project_ids": self.project_ids,
+            "project_count": self.project_count,
+            "year_distribution": self.year_dist,
+            "institute_distribution": self.ic_dist,
+            "activity_code_distribution": self.activity_dist,
+            "organization_distribution": self.org_dist,
+            "funding_mechanism_distribution": self.funding_mech_dist,
+            "active_status_distribution": self.active_dist,
+            "award_amount_stats": award_stats
+        }
+
+
+def get_project_distributions(all_results, need_project_ids=False):
     """
     Calculate distributions of project years, institutes, activity codes,
     organizations, funding mechanisms, active status, and award amounts.
 
     Args:
         all_results (dict): API response containing grant data
+        need_project_ids (bool): Whether to collect the project ID list. Callers that
+            only need how many projects there are can use project_count instead.
     Returns:
         dict: Dictionary containing:
-            - project_ids: List of project ID dicts
+            - project_ids: List of project number strings (empty unless need_project_ids)
+            - project_count: Number of results with a project ID
             - year_distribution: Counter of fiscal years
             - institute_distribution: Counter of NIH institutes/centers
             - activity_code_distribution: Counter of activity codes
@@ -209,90 +592,32 @@ def get_project_distributions(all_results):
             - award_amount_stats: Dict with total, average, min, max award amounts
     """
 
-    results = all_results.get("results", [])
+    accumulator = DistributionAccumulator(need_project_ids)
+    accumulator.update(all_results.get("results", []))
+    return accumulator.finalize()
 
-    # Extract project IDs - handle case where individual results might be strings
-    project_ids = []
-    for r in results:
-        if isinstance(r, dict) and r.get("project_num"):
-            project_ids.append({"project_num": r.get("project_num")})
 
-    # Calculate distributions
-    from collections import Counter
-
-    # Year distribution - only process dict results
-    year_dist = Counter(
-        r.get("fiscal_year")
-        for r in results
-        if isinstance(r, dict) and r.get("fiscal_year")
-    )
-
-    # Institute/Center distribution
-    ic_dist = Counter(
-        r.get("agency_ic_admin")
-        for r in results
-        if isinstance(r, dict) and r.get("agency_ic_admin")
-    )
+async def get_all_distributions(search_params:SearchParams, include_fields: list[str], limit=MAX_PAGE_SIZE, client=None):
+    """
+    Calculate distributions over every project matching the search criteria.
 
-    # Activity code distribution
-    activity_dist = Counter(
-        r.get("activity_code")
-        for r in results
-        if isinstance(r, dict) and r.get("activity_code")
-    )
+    Pages are folded into a DistributionAccumulator as they arrive and then
+    dropped, so memory stays flat however many projects match.
 
-    # Organization distribution (uses org_name from clean_json)
-    org_dist = Counter(
-        r.get("org_name")
-        for r in results
-        if isinstance(r, dict) and r.get("org_name")
-    )
+    Args:
+        search_params (SearchParams): Search parameters including years, agencies, organizations, and pi_name.
+        include_fields (list[str]): Fields to return from the API.
+        limit (int): Number of results to return per request (max 500).
+        client (httpx.AsyncClient, optional): Client to send the requests with. Defaults to the shared client.
 
-    # Funding mechanism distribution
-    funding_mech_dist = Counter(
-        r.get("funding_mechanism")
-        for r in results
-        if isinstance(r, dict) and r.get("funding_mechanism")
-    )
+    Returns:
+        dict: Same structure as get_project_distributions
+    """
 
-    # Active status distribution
-    active_dist = Counter(
-        "Active" if r.get("is_active") else "Inactive"
-        for r in results
-        if isinstance(r, dict) and r.get("is_active") is not None
-    )
+    accumulator = DistributionAccumulator()
+    async for page in iter_pages(search_params, include_fields, limit, client):
+        accumulator.update(page['results'])
 
-    # Award amount statistics
-    award_amounts = [
-        r.get("award_amount")
-        for r in results
-        if isinstance(r, dict) and r.get("award_amount") is not None
-    ]
-
-    if award_amounts:
-        award_stats = {
-            "total": sum(award_amounts),
-            "average": sum(award_amounts) / len(award_amounts),
-            "min": min(award_amounts),
-            "max": max(award_amounts),
-            "count": len(award_amounts)
-        }
-    else:
-        award_stats = {
-            "total": 0,
-            "average": 0,
-            "min": 0,
-            "max": 0,
-            "count": 0
-        }
+    print(f"Summarized {accumulator.project_count} total results")
 
-    return {
-        "project_ids": project_ids,
-        "year_distribution": year_dist,
-        "institute_distribution": ic_dist,
-        "activity_code_distribution": activity_dist,
-        "organization_distribution": org_dist,
-        "funding_mechanism_distribution": funding_mech_dist,
-        "active_status_distribution": active_dist,
-        "award_amount_stats": award_stats
-    }
\ No newline at end of file
+    return accumulator.finalize()